@@ -118,6 +118,12 @@ Benefits:
 - Isolation: Client code is decoupled from concrete classes
 - Single Responsibility: Each factory handles one product family
 
+Shared Products (Flyweight):
+The concrete products here carry no state, so each factory hands out one shared
+instance per product type instead of allocating a new object on every call.
+This is effectively the Flyweight pattern. A subclass that adds per-instance
+state must override the factory method and return a fresh instance.
+
 Trade-offs:
 - Can be complex for simple use cases
 - Adding new product types requires changing all factory interfaces
@@ -125,38 +131,60 @@ Trade-offs:
 
 
 """
+import sys
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 
 # Abstract products
 class Button(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def render(self) -> str:
         pass
 
 class Checkbox(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def render(self) -> str:
         pass
 
+# Rendered output is a per-class constant, evaluated once at class definition.
+# Concrete products must define RENDER; there is deliberately no default.
+class _ConstRender:
+    __slots__ = ()
+
+    def render(self) -> str:
+        return self.RENDER
+
 # Concrete products - Windoes Style
-class WindosButton(Button):
-    def render(self) ->str:
-        return "Rendering Windows-style button"
+class WindosButton(_ConstRender, Button):
+    __slots__ = ()
+    RENDER = "Rendering Windows-style button"
     
-class WindowsCheckbox(Checkbox):
-    def render(self) -> str:
-        return "Rendering Windows-style checkbox"
+class WindowsCheckbox(_ConstRender, Checkbox):
+    __slots__ = ()
+    RENDER = "Rendering Windows-style checkbox"
 # Concrete products - MacOS Style
-class MacOSButton(Button):
-    def render(self) -> str:
-        return "Rendering MacOS-style button"
+class MacOSButton(_ConstRender, Button):
+    __slots__ = ()
+    RENDER = "Rendering MacOS-style button"
     
-class MackOSCheckbox(Checkbox):
-    def render(self) -> str:
-        return "Rendering MacOS-style checkbox"
+class MackOSCheckbox(_ConstRender, Checkbox):
+    __slots__ = ()
+    RENDER = "Rendering MacOS-style checkbox"
+
+# Shared stateless product instances (see "Shared Products" above)
+_WIN_BTN = WindosButton()
+_WIN_CHK = WindowsCheckbox()
+_MAC_BTN = MacOSButton()
+_MAC_CHK = MackOSCheckbox()
     
 # Abstract factory
 class GUIFactory(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def create_button(self) -> Button:
         pass
@@ -167,78 +195,103 @@ class GUIFactory(ABC):
 
 # Concrete factories
 class WindowsFactory(GUIFactory):
+    __slots__ = ()
+
     def create_button(self) -> Button:
-        return WindosButton()
+        return _WIN_BTN
 
     def create_checkbox(self) -> Checkbox:
-        return WindowsCheckbox()
+        return _WIN_CHK
 
 class MacOSFactory(GUIFactory):
+    __slots__ = ()
+
     def create_button(self) -> Button:
-        return MacOSButton()
+        return _MAC_BTN
 
     def create_checkbox(self) -> Checkbox:
-        return MackOSCheckbox()
+        return _MAC_CHK
     
 # Client code
 class Application:
+    __slots__ = ("factory",)
+
     def __init__(self, factory: GUIFactory):
         self.factory = factory
 
 
     def create_ui(self):
-        button = self.factory.create_button()
-        checkbox = self.factory.create_checkbox()
+        factory = self.factory
+        button = factory.create_button()
+        checkbox = factory.create_checkbox()
 
-        print(button.render())
-        print(checkbox.render())
+        sys.stdout.write(button.render() + "\n" + checkbox.render() + "\n")
         return button, checkbox
+
+    def create_ui_silent(self):
+        """Create the UI components without rendering them (no I/O)."""
+        factory = self.factory
+        return factory.create_button(), factory.create_checkbox()
     
 # Factory selection function
 
+# Factories are stateless, so one shared instance per platform is built once
+# at import time and handed out on every lookup (read-only view).
+_WIN = sys.intern("windows")
+_MAC = sys.intern("macos")
+_WIN_FACTORY = WindowsFactory()
+_MAC_FACTORY = MacOSFactory()
+_FACTORIES = MappingProxyType({
+    _WIN: _WIN_FACTORY,
+    _MAC: _MAC_FACTORY
+})
+
 def get_factory(platform: str) -> GUIFactory:
     """ Factory selection based on platform."""
-    factories = {
-        "windows": WindowsFactory(),
-        "macos": MacOSFactory()
-    }
-    factory = factories.get(platform.lower())
-    if not factory:
+    # Fast path: interned lowercase names (e.g. string literals) match by
+    # identity, skipping the lower() allocation and the dict hash.
+    if platform is _WIN:
+        return _WIN_FACTORY
+    if platform is _MAC:
+        return _MAC_FACTORY
+    factory = _FACTORIES.get(platform.lower())
+    if factory is None:
         raise ValueError(f"Unsupported platform: {platform}")
     return factory
 
 # Example usage
-if __name__ == "__main__":
-    print("=== Abstract Factory Pattern Demo ===\n")
-    
+def _demo() -> str:
+    """Run the demo and return its output, so it can be profiled without I/O."""
+    lines = ["=== Abstract Factory Pattern Demo ===\n"]
+
     # Demonstrate Windows UI
-    print("Creating Windows Application:")
+    lines.append("Creating Windows Application:")
     windows_factory = get_factory("windows")
     windows_app = Application(windows_factory)
-    windows_app.create_ui()
-    
-    print("\n" + "-" * 40 + "\n")
-    
+    lines.extend(product.render() for product in windows_app.create_ui_silent())
+
+    lines.append("\n" + "-" * 40 + "\n")
+
     # Demonstrate MacOS UI
-    print("Creating MacOS Application:")
+    lines.append("Creating MacOS Application:")
     macos_factory = get_factory("macos")
     macos_app = Application(macos_factory)
-    macos_app.create_ui()
-    
-    print("\n" + "-" * 40 + "\n")
-    
+    lines.extend(product.render() for product in macos_app.create_ui_silent())
+
+    lines.append("\n" + "-" * 40 + "\n")
+
     # Example with error handling
     try:
-        print("Attempting to create Linux Application:")
-        linux_factory = get_factory("linux")
+        lines.append("Attempting to create Linux Application:")
+        get_factory("linux")
     except ValueError as e:
-        print(f"Error: {e}")
-    
-    print("\n=== Dynamic Factory Selection ===")
-    
+        lines.append(f"Error: {e}")
+
+    lines.append("\n=== Dynamic Factory Selection ===")
+
     # Simulate runtime platform detection
     import platform as sys_platform
-    
+
     # For demo purposes, we'll map actual system to our supported platforms
     system_name = sys_platform.system().lower()
     platform_map = {
@@ -246,10 +299,15 @@ if __name__ == "__main__":
         'darwin': 'macos',  # macOS returns 'Darwin'
         'linux': 'windows'  # Default to windows for unsupported platforms
     }
-    
+
     detected_platform = platform_map.get(system_name, 'windows')
-    print(f"Detected platform: {sys_platform.system()} -> Using {detected_platform} factory")
-    
+    lines.append(f"Detected platform: {sys_platform.system()} -> Using {detected_platform} factory")
+
     auto_factory = get_factory(detected_platform)
     auto_app = Application(auto_factory)
-    auto_app.create_ui()
\ No newline at end of file
+    lines.extend(product.render() for product in auto_app.create_ui_silent())
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    sys.stdout.write(_demo())
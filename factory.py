@@ -40,6 +40,7 @@ Pattern Components in this Code:
 5.  Client: The `client_code` function.
 """
 
+import sys
 from abc import ABC, abstractmethod
 
 # --- 1. Product Interface ---
@@ -48,29 +49,61 @@ class DataFormat(ABC):
     The Product interface declares the operations that all concrete products must
     implement. The client code will work with objects of this type.
     """
+    __slots__ = ()
+
     @abstractmethod
     def process(self, file_name: str) -> str:
         """Processes the file and returns a status string."""
         pass
 
+    def process_many(self, file_names: list[str]) -> list[str]:
+        """Processes a batch of files and returns one status string per file."""
+        process = self.process
+        return [process(file_name) for file_name in file_names]
+
 # --- 2. Concrete Products ---
 class JsonFormat(DataFormat):
     """Concrete Product for handling JSON data."""
+    __slots__ = ()
+
     def process(self, file_name: str) -> str:
         return f"Processing '{file_name}' using the JSON handler."
 
 class XmlFormat(DataFormat):
     """Concrete Product for handling XML data."""
+    __slots__ = ()
+
     def process(self, file_name: str) -> str:
         return f"Processing '{file_name}' using the XML handler."
 
 
+# Products are stateless, so one shared instance per file extension is enough.
+_HANDLERS = {
+    "json": JsonFormat(),
+    "xml": XmlFormat(),
+}
+
+
+def process_file(file_name: str) -> str:
+    """
+    Table-driven alternative to the creator classes: picks the handler by file
+    extension with a single dict lookup, without instantiating a creator.
+    """
+    ext = file_name.rsplit(".", 1)[-1].lower()
+    handler = _HANDLERS.get(ext)
+    if handler is None:
+        raise ValueError(f"Unsupported file type: {file_name}")
+    return handler.process(file_name)
+
+
 # --- 3. Creator Class ---
 class FileProcessor(ABC):
     """
     The Creator class declares the factory method `create_handler` that is
     meant to return an object of a Product class.
     """
+    __slots__ = ("file_name",)
+
     def __init__(self, file_name: str):
         self.file_name = file_name
 
@@ -100,18 +133,22 @@ class FileProcessor(ABC):
 class JsonFileProcessor(FileProcessor):
     """
     Concrete Creator for JSON files. Overrides the factory method to return
-    a JsonFormat instance.
+    the shared JsonFormat instance.
     """
+    __slots__ = ()
+
     def create_handler(self) -> DataFormat:
-        return JsonFormat()
+        return _HANDLERS["json"]
 
 class XmlFileProcessor(FileProcessor):
     """
     Concrete Creator for XML files. Overrides the factory method to return
-    an XmlFormat instance.
+    the shared XmlFormat instance.
     """
+    __slots__ = ()
+
     def create_handler(self) -> DataFormat:
-        return XmlFormat()
+        return _HANDLERS["xml"]
 
 
 # --- 5. Client Code ---
@@ -121,13 +158,25 @@ def client_code(processor: FileProcessor):
     its base interface. As long as the client keeps working with the creator via
     the base interface, you can pass it any creator's subclass.
     """
-    print("Client: I'm not aware of the processor's concrete class, but it works.")
-    print(processor.run_processing(), end="\n\n")
+    sys.stdout.write(_client_report(processor) + "\n")
 
 
-if __name__ == "__main__":
-    print("App: Launched with the JsonFileProcessor.")
-    client_code(JsonFileProcessor("document.json"))
+def _client_report(processor: FileProcessor) -> str:
+    """The text client_code prints, built without doing any I/O."""
+    return ("Client: I'm not aware of the processor's concrete class, but it works.\n"
+            + processor.run_processing() + "\n")
 
-    print("App: Launched with the XmlFileProcessor.")
-    client_code(XmlFileProcessor("spreadsheet.xml"))
+
+def _demo() -> str:
+    """Run the demo and return its output, so it can be profiled without I/O."""
+    lines = [
+        "App: Launched with the JsonFileProcessor.",
+        _client_report(JsonFileProcessor("document.json")),
+        "App: Launched with the XmlFileProcessor.",
+        _client_report(XmlFileProcessor("spreadsheet.xml")),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    sys.stdout.write(_demo())
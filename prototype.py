@@ -42,6 +42,10 @@ Python provides built-in support for the Prototype pattern through the 'copy' mo
    - Creates a new object and recursively copies all nested objects
    - Completely independent copy - changes don't affect the original
 
+Note: DataMatrix overrides __copy__, so copy.copy() on it returns an independent
+clone (array and metadata copied) rather than a shallow copy; Prototype uses it
+as the fast cloner for DataMatrix.
+
 Implementation Notes:
 - Use shallow copy when you want to share references to nested objects
 - Use deep copy when you need complete independence between objects
@@ -55,13 +59,67 @@ Example Use Cases:
 """
 
 import copy
+import functools
+import sys
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; clone_many falls back to NumPy
+    njit = None
+
+
+def _bulk_clone_numpy(src, out):
+    out[...] = src
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _bulk_clone_jit(src, out):
+        for i in prange(out.shape[0]):
+            out[i] = src
+
+    def _bulk_clone(src, out):
+        # numba only compiles numeric dtypes (and not float16); object,
+        # string and half-precision arrays use the NumPy copy instead
+        kind = src.dtype.kind
+        if kind in "biuc" or (kind == "f" and src.dtype.itemsize > 2):
+            _bulk_clone_jit(src, out)
+        else:
+            _bulk_clone_numpy(src, out)
+else:
+    _bulk_clone = _bulk_clone_numpy
+
+
+def _array_payload(proto):
+    """Return the ndarray behind a prototype (itself, or its .data)."""
+    # ndarrays have their own .data (a memoryview), so check them first
+    if isinstance(proto, np.ndarray):
+        return proto
+    src = getattr(proto, "data", None)
+    if not isinstance(src, np.ndarray):
+        raise TypeError(
+            "Prototype must be a NumPy array or hold one in .data, "
+            f"got {type(proto).__name__}"
+        )
+    return src
+
 
 class Prototype:
+    __slots__ = ("_objects",)
+
+    # Per-type cloners used instead of copy.deepcopy for known structures.
+    # Extend with Prototype.register_cloner(SomeType, fn).
+    # order="K" keeps the memory layout (e.g. Fortran order), like deepcopy.
+    _CLONERS = {np.ndarray: functools.partial(np.copy, order="K")}
+
     def __init__(self):
         self._objects = {}
-        
+
+    @classmethod
+    def register_cloner(cls, obj_type, cloner):
+        cls._CLONERS[obj_type] = cloner
+
     def register_object(self, name, obj):
         self._objects[name] = obj
 
@@ -69,10 +127,93 @@ class Prototype:
         del self._objects[name]
 
     def clone(self, name, **attrs):
-        cloned_obj = copy.deepcopy(self._objects.get(name))
-        cloned_obj.__dict__.update(attrs)
+        proto = self._objects[name]  # unknown names raise KeyError here
+        cloned_obj = self._CLONERS.get(type(proto), copy.deepcopy)(proto)
+        if attrs:
+            for key, value in attrs.items():
+                setattr(cloned_obj, key, value)
         return cloned_obj
 
+    def clone_into(self, name, out):
+        """Copy a prototype's array payload into a preallocated array."""
+        np.copyto(out, _array_payload(self._objects[name]))
+        return out
+
+    def clone_many(self, name, n, mutate_fn=None):
+        """
+        Clone the array payload of a registered prototype n times at once.
+
+        Returns an array of shape (n, *data.shape); mutate_fn, if given, is
+        called with (index, row) for each clone to tweak it in place.
+        """
+        src = _array_payload(self._objects[name])
+        out = np.empty((n, *src.shape), src.dtype)
+        _bulk_clone(src, out)
+        if mutate_fn is not None:
+            for i in range(n):
+                mutate_fn(i, out[i])
+        return out
+
+
+class BatchPrototype:
+    """
+    Registry for same-shape array prototypes stored in one contiguous array.
+    The dtype defaults to float32 to match DataMatrix.
+
+    Prototypes are rows of a single (n, *shape) ndarray, with names and
+    metadata kept in parallel lists, so cloning many copies is a single
+    allocation + memcpy instead of a Python loop of per-object copies.
+    """
+
+    def __init__(self, shape, dtype=np.float32, capacity=8):
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self._data = np.empty((capacity, *shape), dtype)
+        self._names = []
+        self._metadata = []
+        self._index = {}
+
+    def register_object(self, name, matrix):
+        data = _array_payload(matrix)
+        if data.shape != self._data.shape[1:]:
+            raise ValueError(
+                f"Prototype '{name}' has shape {data.shape}, "
+                f"expected {self._data.shape[1:]}"
+            )
+        i = self._index.get(name)
+        if i is None:
+            i = len(self._names)
+            if i == self._data.shape[0]:
+                grown = np.empty((2 * i, *self._data.shape[1:]), self._data.dtype)
+                grown[:i] = self._data
+                self._data = grown
+            self._names.append(name)
+            self._metadata.append(None)
+            self._index[name] = i
+        self._data[i] = data
+        self._metadata[i] = copy.deepcopy(getattr(matrix, "metadata", {}))
+
+    def unregister_object(self, name):
+        # Swap the last prototype into the freed row to keep storage dense
+        i = self._index.pop(name)
+        last = len(self._names) - 1
+        if i != last:
+            self._data[i] = self._data[last]
+            self._names[i] = self._names[last]
+            self._metadata[i] = self._metadata[last]
+            self._index[self._names[i]] = i
+        self._names.pop()
+        self._metadata.pop()
+
+    def clone_batch(self, name, count):
+        """Return a (count, *shape) array holding count copies of the prototype."""
+        row = self._data[self._index[name]]
+        return np.broadcast_to(row, (count, *row.shape)).copy()
+
+    def get_metadata(self, name):
+        """Return a copy of the metadata stored with a prototype."""
+        return copy.deepcopy(self._metadata[self._index[name]])
+
 
 def client_prototype(name, obj, **attrs):
     prototype = Prototype()
@@ -81,58 +222,90 @@ def client_prototype(name, obj, **attrs):
 
 
 class DataMatrix:
-    """Simple matrix class for NumPy array demonstration."""
-    
-    def __init__(self, name, data, metadata=None):
+    """
+    Simple matrix class for NumPy array demonstration.
+
+    Data is stored as a contiguous float32 array by default; every clone
+    copies the whole buffer, so a narrower dtype (e.g. np.float16 or
+    np.int16) halves clone cost and memory again where precision allows.
+    Attributes are fixed by __slots__; clone overrides must name one of them.
+    """
+    __slots__ = ("name", "data", "metadata")
+
+    def __init__(self, name, data, metadata=None, dtype=np.float32):
         self.name = name
-        self.data = data
+        self.data = np.ascontiguousarray(data, dtype=dtype)
         self.metadata = metadata or {}
     
+    def __copy__(self):
+        # The structure is known (name, array, metadata), so copy the array
+        # with a C-level memcpy instead of going through deepcopy for it. The
+        # metadata is still deep-copied so nested values aren't shared.
+        # Built via __new__ so subclasses with another __init__ signature work;
+        # subclasses adding state of their own should extend this method.
+        cls = type(self)
+        cloned = cls.__new__(cls)
+        cloned.name = self.name
+        cloned.data = self.data.copy()
+        cloned.metadata = copy.deepcopy(self.metadata)
+        return cloned
+
     def __repr__(self):
         return f"DataMatrix('{self.name}', shape={self.data.shape}, metadata={self.metadata})"
 
 
+# DataMatrix.__copy__ already returns an independent copy, so copy.copy is a
+# safe (and much cheaper) cloner than deepcopy for it.
+Prototype.register_cloner(DataMatrix, copy.copy)
+
+
 # Simple demonstration
-if __name__ == "__main__":
-    print("=== Prototype Pattern with NumPy Arrays ===\n")
-    
+def _demo() -> str:
+    """Run the demo and return its output, so it can be profiled without I/O."""
+    lines = ["=== Prototype Pattern with NumPy Arrays ===\n"]
+
     # Create prototype registry
     registry = Prototype()
-    
+
     # Create and register a prototype
     original_data = np.array([[1, 2, 3], [4, 5, 6]])
     prototype_matrix = DataMatrix("BaseMatrix", original_data, {"version": "1.0"})
     registry.register_object("base_matrix", prototype_matrix)
-    
-    print("Original prototype:")
-    print(prototype_matrix)
-    print("Data:\n", prototype_matrix.data)
-    print()
-    
+
+    lines.append("Original prototype:")
+    lines.append(str(prototype_matrix))
+    lines.append(f"Data:\n {prototype_matrix.data}")
+    lines.append("")
+
     # Clone with modifications
     clone1 = registry.clone("base_matrix")
     clone1.name = "ExperimentA"
     clone1.metadata = {"version": "1.0", "experiment": "A"}
-    
+
     clone2 = registry.clone("base_matrix")
     clone2.name = "ExperimentB"
-    
+
     # Modify clones independently
     clone1.data[0, 0] = 999
     clone2.data[1, 1] = 777
-    
-    print("After modifications:")
-    print("Original:", prototype_matrix)
-    print("Data:\n", prototype_matrix.data)
-    print()
-    print("Clone 1:", clone1)
-    print("Data:\n", clone1.data)
-    print()
-    print("Clone 2:", clone2) 
-    print("Data:\n", clone2.data)
-    print()
-    
+
+    lines.append("After modifications:")
+    lines.append(f"Original: {prototype_matrix}")
+    lines.append(f"Data:\n {prototype_matrix.data}")
+    lines.append("")
+    lines.append(f"Clone 1: {clone1}")
+    lines.append(f"Data:\n {clone1.data}")
+    lines.append("")
+    lines.append(f"Clone 2: {clone2}")
+    lines.append(f"Data:\n {clone2.data}")
+    lines.append("")
+
     # Verify independence
-    print("Arrays are independent:")
-    print(f"Original != Clone1: {id(prototype_matrix.data) != id(clone1.data)}")
-    print(f"Clone1 != Clone2: {id(clone1.data) != id(clone2.data)}")
\ No newline at end of file
+    lines.append("Arrays are independent:")
+    lines.append(f"Original != Clone1: {id(prototype_matrix.data) != id(clone1.data)}")
+    lines.append(f"Clone1 != Clone2: {id(clone1.data) != id(clone2.data)}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    sys.stdout.write(_demo())
@@ -37,6 +37,9 @@ Typically, this is done by:
 3: Using a class variable to hold the single instance.
 
 """
+import sys
+import threading
+
 # Singleton pattern implementation in Python
 # A simple implementation of the Singleton pattern using a class variable
 # This implementation ensures that only one instance of the class can be created.
@@ -56,31 +59,51 @@ class A:
         return cls._instance
     
 
-one = A.get_instance()
-two = A.get_instance()
-
-print("ID of one:", id(one))
-print("ID of two:", id(two))
-
 
 # Using metaclass for Singleton patternb is another common approach.
 # This allows for more control over class creation and can be cleaner in some cases.
 # Example of Singleton using a metaclass
 class Singleton(type):
-    _instaance = None
-
-    def __call__(self, *args, **kwargs):
-        if not self._instaance:
-            self._instaance = super().__call__(*args, **kwargs)
-        return self._instaance
+    def __init__(cls, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # One lock per class, so a singleton whose __init__ creates another
+        # singleton doesn't wait on a lock its own construction is holding.
+        cls._singleton_lock = threading.Lock()
+
+    def __call__(cls, *args, **kwargs):
+        # The instance lives in each class's own __dict__, so classes (and
+        # subclasses) using this metaclass never share one. Double-checked
+        # locking: the lock is only taken while the instance is missing.
+        instance = cls.__dict__.get("_instance")
+        if instance is None:
+            with cls.__dict__["_singleton_lock"]:
+                instance = cls.__dict__.get("_instance")
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._instance = instance
+        return instance
     
 
 
 class B(metaclass=Singleton):
     pass
 
-three = B()
-four = B()
 
-print("ID of three:", id(three))
-print("ID of four:", id(four))
\ No newline at end of file
+def _demo() -> str:
+    """Run the demo and return its output, so it can be profiled without I/O."""
+    one = A.get_instance()
+    two = A.get_instance()
+    three = B()
+    four = B()
+
+    lines = [
+        f"ID of one: {id(one)}",
+        f"ID of two: {id(two)}",
+        f"ID of three: {id(three)}",
+        f"ID of four: {id(four)}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    sys.stdout.write(_demo())